@@ -0,0 +1,38 @@
+"""Numba-compiled terrain kernels for very large worlds.
+
+Importing this module imports numba, so :mod:`minecraft.world` only does
+so for worlds above its size threshold. The loops compute exactly what the
+vectorized NumPy kernels in :mod:`minecraft.world` do, column by column.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from numba import njit
+
+from .world import _hash01
+
+hash01 = njit(cache=True)(_hash01)
+
+
+@njit(cache=True)
+def heightfield(width, depth, seed, sea_level, max_height):
+    heights = np.empty((width, depth), dtype=np.int32)
+    for x in range(width):
+        for z in range(depth):
+            # Coarse ridges using sine waves plus a little per-column jitter.
+            ridge = math.sin((x + seed) * 0.25) + math.cos((z - seed) * 0.3)
+            jitter = hash01(x, z, seed) * 3.0 - 1.5
+            height = int(sea_level + ridge * 1.5 + jitter)
+            heights[x, z] = min(max(height, 1), max_height)
+    return heights
+
+
+@njit(cache=True)
+def column_rolls(width, depth, seed):
+    rolls = np.empty((width, depth), dtype=np.float64)
+    for x in range(width):
+        for z in range(depth):
+            rolls[x, z] = hash01(x, z, seed)
+    return rolls
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, List
 
 
 @dataclass(frozen=True)
@@ -87,14 +88,21 @@ BLOCKS: Dict[str, Block] = {
     ),
 }
 
+# Compact integer ids used by the voxel grid. ``air`` must stay at id 0 so a
+# freshly allocated grid of zeros is empty space.
+ID2BLOCK: List[Block] = list(BLOCKS.values())
+BLOCK2ID: Dict[str, int] = {block.id: index for index, block in enumerate(ID2BLOCK)}
 
+
+@lru_cache(maxsize=64)
 def get_block(block_id: str) -> Block:
     """Return the :class:`Block` instance for ``block_id``.
 
     Parameters
     ----------
     block_id:
-        Identifier of the block to fetch. The lookup is case-insensitive.
+        Identifier of the block to fetch. The lookup is case-insensitive and
+        memoized, as the block table never changes at runtime.
 
     Raises
     ------
@@ -108,18 +116,38 @@ def get_block(block_id: str) -> Block:
     return BLOCKS[normalized]
 
 
-CRAFTING_RECIPES = {
-    "planks": {"log": 1},
+@dataclass(frozen=True)
+class Recipe:
+    """A crafting recipe.
+
+    Parameters
+    ----------
+    ingredients:
+        Mapping of block identifiers to the number consumed.
+    count:
+        How many blocks a single craft produces.
+    """
+
+    ingredients: Dict[str, int]
+    count: int = 1
+
+
+CRAFTING_RECIPES: Dict[str, Recipe] = {
+    "planks": Recipe({"log": 1}, count=4),
 }
 
 
+def _has_ingredients(recipe: Recipe, inventory: Dict[str, int]) -> bool:
+    return all(inventory.get(item, 0) >= count for item, count in recipe.ingredients.items())
+
+
 def can_craft(block_id: str, inventory: Dict[str, int]) -> bool:
     """Return whether the ``inventory`` contains enough resources to craft ``block_id``."""
 
     recipe = CRAFTING_RECIPES.get(block_id)
     if recipe is None:
         return False
-    return all(inventory.get(item, 0) >= count for item, count in recipe.items())
+    return _has_ingredients(recipe, inventory)
 
 
 def craft(block_id: str, inventory: Dict[str, int]) -> bool:
@@ -129,13 +157,11 @@ def craft(block_id: str, inventory: Dict[str, int]) -> bool:
     """
 
     recipe = CRAFTING_RECIPES.get(block_id)
-    if recipe is None:
-        return False
-    if not can_craft(block_id, inventory):
+    if recipe is None or not _has_ingredients(recipe, inventory):
         return False
-    for item, count in recipe.items():
+    for item, count in recipe.ingredients.items():
         inventory[item] -= count
         if inventory[item] <= 0:
             inventory.pop(item)
-    inventory[block_id] = inventory.get(block_id, 0) + 4 if block_id == "planks" else inventory.get(block_id, 0) + 1
+    inventory[block_id] = inventory.get(block_id, 0) + recipe.count
     return True
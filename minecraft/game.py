@@ -1,7 +1,8 @@
 """Text adventure style interface for the sandbox."""
 from __future__ import annotations
 
-from typing import List, Optional
+import sys
+from typing import Callable, Dict, List, Optional
 
 from .blocks import BLOCKS
 from .player import Player
@@ -33,30 +34,26 @@ class Game:
             return ""
         parts = command.split()
         action = parts[0].lower()
-        args = parts[1:]
-
-        if action in {"quit", "exit"}:
-            return "Thanks for playing!"
-        if action in {"help", "?"}:
-            return self._help_text()
-        if action in {"look", "see"}:
-            return self._look()
-        if action in {"map"}:
-            return self._map(args)
-        if action in {"move", "walk", "go"}:
-            return self._move(args)
-        if action in {"harvest", "mine", "break", "dig"}:
-            return self._harvest(args)
-        if action in {"place", "build"}:
-            return self._place(args)
-        if action in {"inventory", "inv"}:
-            return self.player.inventory_summary()
-        if action == "craft":
-            return self._craft(args)
-        if action in {"where", "pos"}:
-            x, y, z = self.player.position
-            return f"You are at ({x}, {y}, {z})."
-        return f"I do not understand '{command}'. Type 'help' for options."
+        handler = _DISPATCH.get(action)
+        if handler is None:
+            return f"I do not understand '{command}'. Type 'help' for options."
+        return handler(self, parts[1:])
+
+    def _quit(self, args: List[str]) -> str:
+        return "Thanks for playing!"
+
+    def _help(self, args: List[str]) -> str:
+        return self._help_text()
+
+    def _look_cmd(self, args: List[str]) -> str:
+        return self._look()
+
+    def _inventory(self, args: List[str]) -> str:
+        return self.player.inventory_summary()
+
+    def _where(self, args: List[str]) -> str:
+        x, y, z = self.player.position
+        return f"You are at ({x}, {y}, {z})."
 
     def _help_text(self) -> str:
         return (
@@ -89,7 +86,7 @@ class Game:
     def _move(self, args: List[str]) -> str:
         if not args:
             return "Move where? Try north, south, east or west."
-        direction = args[0].lower()
+        direction = sys.intern(args[0].lower())
         try:
             moved = self.player.move(direction)
         except ValueError as exc:  # Unknown direction
@@ -151,3 +148,29 @@ class Game:
             print(response)
             if command.strip().lower() in {"quit", "exit"}:
                 break
+
+
+# Command word -> handler, built once instead of testing each alias per command.
+_DISPATCH: Dict[str, Callable[[Game, List[str]], str]] = {
+    "quit": Game._quit,
+    "exit": Game._quit,
+    "help": Game._help,
+    "?": Game._help,
+    "look": Game._look_cmd,
+    "see": Game._look_cmd,
+    "map": Game._map,
+    "move": Game._move,
+    "walk": Game._move,
+    "go": Game._move,
+    "harvest": Game._harvest,
+    "mine": Game._harvest,
+    "break": Game._harvest,
+    "dig": Game._harvest,
+    "place": Game._place,
+    "build": Game._place,
+    "inventory": Game._inventory,
+    "inv": Game._inventory,
+    "craft": Game._craft,
+    "where": Game._where,
+    "pos": Game._where,
+}
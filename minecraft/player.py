@@ -1,9 +1,9 @@
 """Player state and interaction helpers."""
 from __future__ import annotations
 
-from collections import Counter
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Tuple
+from typing import Dict, Hashable, Optional, Tuple
 
 from . import blocks
 from .world import Coordinate, World
@@ -20,6 +20,13 @@ DIRECTIONS: Dict[str, Direction] = {
     "down": (0, -1, 0),
 }
 
+# Private copy keyed by interned strings so lookups with interned input
+# usually resolve on an identity check.
+_DIRECTION_TABLE: Dict[str, Direction] = {sys.intern(name): delta for name, delta in DIRECTIONS.items()}
+
+# Display names by block id, so summaries skip the Block attribute access.
+_NAMES: Dict[str, str] = {block_id: block.name for block_id, block in blocks.BLOCKS.items()}
+
 
 @dataclass
 class Player:
@@ -27,13 +34,22 @@ class Player:
 
     world: World
     position: Coordinate = field(init=False)
-    inventory: Counter = field(default_factory=Counter)
+    inventory: Dict[str, int] = field(default_factory=dict)
+    # Bumped whenever the player moves or the inventory changes, and used
+    # together with the world revision to reuse rendered descriptions.
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _describe_cache: Optional[Tuple[Hashable, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _inventory_cache: Optional[Tuple[Hashable, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         spawn = self.world.spawn_position()
         self.position = (spawn[0], spawn[1] + 1, spawn[2])
         # Provide a starting kit for building shelters.
-        self.inventory.update({"planks": 8})
+        self.inventory["planks"] = 8
 
     # ------------------------------------------------------------------
     # Movement
@@ -41,17 +57,17 @@ class Player:
     def move(self, direction: str) -> bool:
         """Move the player in ``direction`` if possible."""
 
-        if direction not in DIRECTIONS:
-            raise ValueError(f"Unknown direction: {direction}")
-
-        dx, dy, dz = DIRECTIONS[direction]
+        try:
+            dx, dy, dz = _DIRECTION_TABLE[direction]
+        except KeyError:
+            raise ValueError(f"Unknown direction: {direction}") from None
         x, y, z = self.position
         new_position = (x + dx, y + dy, z + dz)
 
-        if direction in {"up", "down"}:
-            target_block = self.world.get_block(new_position)
-            if target_block.id == "air" or target_block.id == "water":
+        if dy:
+            if self.world.is_open(new_position):
                 self.position = new_position
+                self._version += 1
                 return True
             return False
 
@@ -64,6 +80,7 @@ class Player:
         if dest_y >= self.world.bounds.height:
             return False
         self.position = (dest_x, dest_y, dest_z)
+        self._version += 1
         return True
 
     # ------------------------------------------------------------------
@@ -73,22 +90,24 @@ class Player:
         x, y, z = self.position
         if direction is None:
             direction = "up"
-        if direction not in DIRECTIONS:
-            raise ValueError(f"Unknown direction: {direction}")
-        dx, dy, dz = DIRECTIONS[direction]
+        try:
+            dx, dy, dz = _DIRECTION_TABLE[direction]
+        except KeyError:
+            raise ValueError(f"Unknown direction: {direction}") from None
         return (x + dx, y + dy, z + dz)
 
     def harvest(self, direction: Optional[str] = None) -> Optional[str]:
         """Break the block in ``direction`` and add it to the inventory."""
 
         target = self._target_from_direction(direction)
-        block = self.world.get_block(target)
-        if block.id in {"air", "water"}:
+        if self.world.is_open(target):
             return None
         removed = self.world.remove_block(target)
         if removed is None:
             return None
-        self.inventory[removed.id] += 1
+        inventory = self.inventory
+        inventory[removed.id] = inventory.get(removed.id, 0) + 1
+        self._version += 1
         return removed.id
 
     def place(self, block_id: str, direction: Optional[str] = None) -> bool:
@@ -98,20 +117,24 @@ class Player:
         block_id = block_id.lower()
         if self.inventory.get(block_id, 0) <= 0:
             return False
-        existing = self.world.get_block(target)
-        if existing.id != "air" and existing.id != "water":
+        if not self.world.is_open(target):
             return False
         placed = self.world.set_block(target, block_id)
         if placed:
-            self.inventory[block_id] -= 1
-            if self.inventory[block_id] <= 0:
-                del self.inventory[block_id]
+            inventory = self.inventory
+            inventory[block_id] -= 1
+            if inventory[block_id] <= 0:
+                del inventory[block_id]
+            self._version += 1
         return placed
 
     def craft(self, block_id: str) -> bool:
         """Attempt to craft ``block_id`` using available resources."""
 
-        return blocks.craft(block_id, self.inventory)
+        crafted = blocks.craft(block_id, self.inventory)
+        if crafted:
+            self._version += 1
+        return crafted
 
     # ------------------------------------------------------------------
     # Presentation helpers
@@ -119,6 +142,10 @@ class Player:
     def describe_surroundings(self) -> str:
         """Return a textual description of nearby blocks."""
 
+        key = (self._version, self.position, self.world.revision)
+        cached = self._describe_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
         x, y, z = self.position
         head_block = self.world.get_block((x, y, z))
         ground_block = self.world.get_block((x, y - 1, z))
@@ -128,10 +155,21 @@ class Player:
             f"There is {head_block.name.lower()} at head height.",
             f"Beneath you lies {below_block.name.lower()}.",
         ]
-        return " \n".join(descriptions)
+        text = " \n".join(descriptions)
+        self._describe_cache = (key, text)
+        return text
 
     def inventory_summary(self) -> str:
+        # The snapshot keeps the cache honest if the dict is edited directly.
+        key = (self._version, frozenset(self.inventory.items()))
+        cached = self._inventory_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
         if not self.inventory:
-            return "Your inventory is empty."
-        parts = [f"{count} x {blocks.BLOCKS[item].name}" for item, count in sorted(self.inventory.items())]
-        return "You carry: " + ", ".join(parts)
+            text = "Your inventory is empty."
+        else:
+            text = "You carry: " + ", ".join(
+                f"{count} x {_NAMES[item]}" for item, count in sorted(self.inventory.items())
+            )
+        self._inventory_cache = (key, text)
+        return text
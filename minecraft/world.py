@@ -1,15 +1,223 @@
 """Procedural world generation and manipulation helpers."""
 from __future__ import annotations
 
-import math
+import functools
 import random
 from dataclasses import dataclass
-from typing import Dict, Iterable, Iterator, Optional, Tuple
+from typing import Callable, Iterable, Iterator, Optional, Tuple
 
-from .blocks import BLOCKS, Block
+import numpy as np
+
+from .blocks import BLOCK2ID, BLOCKS, ID2BLOCK, Block
 
 Coordinate = Tuple[int, int, int]
 
+AIR_ID = BLOCK2ID["air"]
+GRASS_ID = BLOCK2ID["grass"]
+DIRT_ID = BLOCK2ID["dirt"]
+STONE_ID = BLOCK2ID["stone"]
+WATER_ID = BLOCK2ID["water"]
+SAND_ID = BLOCK2ID["sand"]
+LOG_ID = BLOCK2ID["log"]
+LEAVES_ID = BLOCK2ID["leaves"]
+
+# Per-id lookup of the cells a player can occupy or build into. Open cells
+# also do not count towards a column's height.
+_OPEN = np.zeros(len(ID2BLOCK), dtype=bool)
+_OPEN[[AIR_ID, WATER_ID]] = True
+
+_MAP_SYMBOLS = {
+    "air": " ",
+    "grass": "▒",
+    "sand": ".",
+    "dirt": "░",
+    "stone": "■",
+    "water": "~",
+    "log": "|",
+    "leaves": "*",
+    "planks": "#",
+}
+# Map symbol for every block id, in ``ID2BLOCK`` order.
+_SYMBOL_BY_ID: Tuple[str, ...] = tuple(_MAP_SYMBOLS.get(block.id, "?") for block in ID2BLOCK)
+# Array form of the same table so ``top_view`` maps a whole window at once.
+_SYMBOL_TABLE = np.array(_SYMBOL_BY_ID, dtype="<U1")
+
+_NEIGHBOR_DELTAS: Tuple[Tuple[int, int, int], ...] = (
+    (1, 0, 0),
+    (-1, 0, 0),
+    (0, 1, 0),
+    (0, -1, 0),
+    (0, 0, 1),
+    (0, 0, -1),
+)
+
+# Source for a ``top_view`` renderer with the window size baked in as
+# literals; ``_compiled_top_view`` fills in the radius and compiles it.
+_TOP_VIEW_TEMPLATE = """
+def top_view(top_id, cx, cz, width, depth, symbols):
+    ox = cx - {radius}
+    oz = cz - {radius}
+    if ox >= 0 and oz >= 0 and ox + {size} <= width and oz + {size} <= depth:
+        view = symbols[top_id[ox : ox + {size}, oz : oz + {size}]]
+    else:
+        view = np.full(({size}, {size}), " ", dtype="<U1")
+        x0, x1 = max(ox, 0), min(ox + {size}, width)
+        z0, z1 = max(oz, 0), min(oz + {size}, depth)
+        if x0 < x1 and z0 < z1:
+            view[x0 - ox : x1 - ox, z0 - oz : z1 - oz] = symbols[top_id[x0:x1, z0:z1]]
+    return "\\n".join(["".join(row) for row in view.T[::-1].tolist()])
+"""
+
+
+@functools.lru_cache(maxsize=16)
+def _compiled_top_view(radius: int) -> Callable[..., str]:
+    """Return a ``top_view`` renderer specialised for ``radius``.
+
+    The returned function takes ``(top_id, cx, cz, width, depth, symbols)``
+    and renders rows from north (high z) to south, columns west to east.
+    Cells outside the world are left blank.
+    """
+
+    source = _TOP_VIEW_TEMPLATE.format(radius=radius, size=2 * radius + 1)
+    namespace = {"np": np}
+    exec(compile(source, f"<top_view radius={radius}>", "exec"), namespace)
+    return namespace["top_view"]
+
+
+# ----------------------------------------------------------------------
+# Generation kernels
+#
+# Terrain noise is computed with vectorized NumPy. Numba is only imported
+# for worlds of at least ``_JIT_MIN_COLUMNS`` columns: below that, importing
+# it costs far more than the compiled loops save.
+
+# World seeds are folded to 32 bits before generation so negative or huge
+# seeds still give a small, exactly representable ridge phase.
+_SEED_MASK = 0xFFFF_FFFF
+_TREE_SALT = 0x2545_F491_4F6C_DD1D
+_JIT_MIN_COLUMNS = 4096 * 4096
+# Keep 53 bits so the hash maps exactly onto the doubles in [0, 1).
+_MANTISSA_MASK = (1 << 53) - 1
+_MANTISSA_SCALE = float(1 << 53)
+# Leaf canopy around the top of a trunk, relative to ``(x, base + 3, z)``.
+_LEAF_OFFSETS: Tuple[Tuple[int, int, int], ...] = tuple(
+    (dx, dy, dz)
+    for dx in range(-2, 3)
+    for dy in range(-1, 2)
+    for dz in range(-2, 3)
+    if abs(dx) + abs(dy) + abs(dz) <= 4
+)
+_LEAF_OFFSET_ARRAY = np.array(_LEAF_OFFSETS, dtype=np.int64)
+
+
+def _hash01(x, z, seed):
+    """Return deterministic pseudo random floats in ``[0, 1)`` for columns.
+
+    A splitmix64-style mix of the column coordinates and seed. ``x`` and
+    ``z`` may be ints or broadcastable integer arrays; ``minecraft._jit``
+    compiles the same code for its scalar loops.
+    """
+
+    k = np.uint64(x) * np.uint64(0x9E3779B97F4A7C15)
+    k = k ^ (np.uint64(z) * np.uint64(0xBF58476D1CE4E5B9))
+    k = k ^ np.uint64(seed)
+    k = k ^ (k >> np.uint64(30))
+    k = k * np.uint64(0xBF58476D1CE4E5B9)
+    k = k ^ (k >> np.uint64(27))
+    return (k & np.uint64(_MANTISSA_MASK)) / _MANTISSA_SCALE
+
+
+def _heightfield(width, depth, seed, sea_level, max_height):
+    xs = np.arange(width)[:, None]
+    zs = np.arange(depth)[None, :]
+    # Coarse ridges using sine waves plus a little per-column jitter.
+    ridge = np.sin((xs + seed) * 0.25) + np.cos((zs - seed) * 0.3)
+    jitter = _hash01(xs, zs, seed) * 3.0 - 1.5
+    heights = (sea_level + ridge * 1.5 + jitter).astype(np.int32)
+    return np.clip(heights, 1, max_height)
+
+
+def _column_rolls(width, depth, seed):
+    return _hash01(np.arange(width)[:, None], np.arange(depth)[None, :], seed)
+
+
+def _place_trees(grid, heights, rolls, sea_level):
+    """Plant trees on the marked columns with two batched fancy-index stores."""
+
+    width, world_height, depth = grid.shape
+    planted = (heights >= sea_level) & (heights + 5 < world_height) & (rolls < 0.05)
+    tx, tz = np.nonzero(planted)
+    ty = heights[tx, tz] + 1
+    # Leaves: every canopy offset around every trunk top, clipped to the world.
+    lx = (tx[:, None] + _LEAF_OFFSET_ARRAY[:, 0]).ravel()
+    ly = (ty[:, None] + 3 + _LEAF_OFFSET_ARRAY[:, 1]).ravel()
+    lz = (tz[:, None] + _LEAF_OFFSET_ARRAY[:, 2]).ravel()
+    inside = np.logical_and.reduce(
+        (lx >= 0, lx < width, ly >= 0, ly < world_height, lz >= 0, lz < depth)
+    )
+    grid[lx[inside], ly[inside], lz[inside]] = LEAVES_ID
+    # Trunks go in last so they run through the canopy; the height check above
+    # already keeps them inside the world.
+    trunk_y = (ty[:, None] + np.arange(4)).ravel()
+    grid[np.repeat(tx, 4), trunk_y, np.repeat(tz, 4)] = LOG_ID
+
+
+def _top_levels(filled: np.ndarray) -> np.ndarray:
+    # argmax over the flipped y axis finds the highest filled level.
+    top = filled.shape[1] - 1 - np.argmax(filled[:, ::-1, :], axis=1)
+    return np.where(filled.any(axis=1), top, 0)
+
+
+def _solid_heights(grid: np.ndarray) -> np.ndarray:
+    return _top_levels(~_OPEN[grid]).astype(np.int16)
+
+
+def _top_ids(grid: np.ndarray) -> np.ndarray:
+    top = _top_levels(grid != AIR_ID)
+    # Empty columns report level 0, which holds air and so yields AIR_ID.
+    return np.take_along_axis(grid, top[:, None, :], axis=1)[:, 0, :]
+
+
+@functools.lru_cache(maxsize=8)
+def _build_world(
+    width: int, depth: int, height: int, seed: int, sea_level: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Generate the voxel grid, heightmap and top-id grid for a world.
+
+    Results are cached per world shape and seed and shared between worlds,
+    so the returned arrays are read-only; callers copy them before editing.
+    """
+
+    seed = seed & _SEED_MASK
+    heightfield, column_rolls = _heightfield, _column_rolls
+    if width * depth >= _JIT_MIN_COLUMNS:
+        try:
+            from ._jit import column_rolls, heightfield
+        except ImportError:  # pragma: no cover - numba is an optional accelerator
+            pass
+    # The hash relies on wrapping uint64 arithmetic.
+    with np.errstate(over="ignore"):
+        heights = heightfield(width, depth, seed, sea_level, height - 2)
+        tree_rolls = column_rolls(width, depth, seed ^ _TREE_SALT)
+    grid = np.zeros((width, height, depth), dtype=np.uint8)
+    # Broadcast the column heights against every y level at once.
+    y_idx = np.arange(height)[None, :, None]
+    surface = heights[:, None, :]
+    grid[y_idx < surface - 3] = STONE_ID
+    grid[(y_idx >= surface - 3) & (y_idx < surface)] = DIRT_ID
+    grid[(y_idx == surface) & (surface >= sea_level)] = GRASS_ID
+    grid[(y_idx == surface) & (surface < sea_level)] = SAND_ID
+    # Fill columns with water up to the sea level.
+    grid[(y_idx > surface) & (y_idx <= sea_level)] = WATER_ID
+
+    # Plant the occasional tree on dry land with enough headroom.
+    _place_trees(grid, heights, tree_rolls, sea_level)
+
+    arrays = (grid, _solid_heights(grid), _top_ids(grid))
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
 
 @dataclass(frozen=True)
 class Bounds:
@@ -36,74 +244,59 @@ class World:
         if width <= 0 or depth <= 0 or height <= 4:
             raise ValueError("World dimensions must be positive with height > 4")
         self.bounds = Bounds(width, depth, height)
+        # Plain int copies of the bounds for the inline checks on hot paths.
+        self._width, self._height, self._depth = width, height, depth
         self.seed = seed if seed is not None else random.randint(0, 2**31 - 1)
         self.random = random.Random(self.seed)
         self.sea_level = height // 3 + 2
-        self._blocks: Dict[Coordinate, Block] = {}
-        self._generate_world()
+        grid, heightmap, top_id = _build_world(width, depth, height, self.seed, self.sea_level)
+        # Dense voxel storage indexed as ``[x, y, z]``; values are ids into ``ID2BLOCK``.
+        self._grid = grid.copy()
+        # Cached ``column_height`` result for every ``(x, z)`` column.
+        self._heightmap = heightmap.copy()
+        # Id of the topmost non-air block (water included) of every column.
+        self._top_id = top_id.copy()
+        self._revision = 0
 
     # ------------------------------------------------------------------
-    # Generation helpers
-
-    def _generate_world(self) -> None:
-        for x in range(self.bounds.width):
-            for z in range(self.bounds.depth):
-                column_height = self._compute_surface_height(x, z)
-                column_height = max(1, min(self.bounds.height - 2, column_height))
-                for y in range(column_height + 1):
-                    if y == column_height:
-                        block_id = "grass" if column_height >= self.sea_level else "sand"
-                    elif y >= column_height - 3:
-                        block_id = "dirt"
-                    else:
-                        block_id = "stone"
-                    self._blocks[(x, y, z)] = BLOCKS[block_id]
-
-                # Fill the column with water if below the sea level.
-                if column_height < self.sea_level:
-                    for y in range(column_height + 1, self.sea_level + 1):
-                        if y < self.bounds.height:
-                            self._blocks[(x, y, z)] = BLOCKS["water"]
-
-                # Plant the occasional tree.
-                if (
-                    column_height >= self.sea_level
-                    and column_height + 5 < self.bounds.height
-                    and self._tree_rng(x, z) < 0.05
-                ):
-                    self._grow_tree((x, column_height + 1, z))
-
-    def _tree_rng(self, x: int, z: int) -> float:
-        tree_random = random.Random((x * 341873128712 + z * 132897987541 + self.seed) & 0xFFFFFFFF)
-        return tree_random.random()
-
-    def _grow_tree(self, trunk_base: Coordinate) -> None:
-        x, y, z = trunk_base
-        for offset in range(4):
-            self._blocks[(x, y + offset, z)] = BLOCKS["log"]
-        leaf_positions = [
-            (x + dx, y + 3 + dy, z + dz)
-            for dx in range(-2, 3)
-            for dy in range(-1, 2)
-            for dz in range(-2, 3)
-            if abs(dx) + abs(dy) + abs(dz) <= 4
-        ]
-        for pos in leaf_positions:
-            if self.bounds.contains(pos):
-                self._blocks[pos] = BLOCKS["leaves"]
-
-    def _compute_surface_height(self, x: int, z: int) -> int:
-        # Coarse ridges using sine waves.
-        ridge = math.sin((x + self.seed) * 0.25) + math.cos((z - self.seed) * 0.3)
-        # Small local variance using a deterministic RNG per column.
-        column_rng = random.Random((x * 49632) ^ (z * 325176) ^ self.seed)
-        jitter = column_rng.uniform(-1.5, 1.5)
-        height = int(self.sea_level + ridge * 1.5 + jitter)
-        return height
+    # Column cache helpers
+
+    def _scan_column_height(self, x: int, z: int) -> int:
+        column = self._grid[x, :, z]
+        filled = np.flatnonzero(~_OPEN[column])
+        if filled.size == 0:
+            return 0
+        return int(filled[-1])
+
+    def _scan_top_id(self, x: int, z: int) -> int:
+        column = self._grid[x, :, z]
+        filled = np.flatnonzero(column)
+        if filled.size == 0:
+            return AIR_ID
+        return int(column[filled[-1]])
+
+    def _update_column(self, position: Coordinate, block_id: int) -> None:
+        x, y, z = position
+        current = self._heightmap[x, z]
+        if not _OPEN[block_id]:
+            if y > current:
+                self._heightmap[x, z] = y
+        elif y == current:
+            # The top of the column was cleared; look for the next one down.
+            self._heightmap[x, z] = self._scan_column_height(x, z)
+        # Edits below the visible top never change what the map shows.
+        if not self._grid[x, y + 1 :, z].any():
+            self._top_id[x, z] = block_id if block_id != AIR_ID else self._scan_top_id(x, z)
 
     # ------------------------------------------------------------------
     # Public API
 
+    @property
+    def revision(self) -> int:
+        """Counter incremented on every block edit, for caching derived views."""
+
+        return self._revision
+
     def spawn_position(self) -> Coordinate:
         """Return a solid spawn position close to the center of the map."""
 
@@ -114,11 +307,7 @@ class World:
     def column_height(self, x: int, z: int) -> int:
         """Return the highest non-air block for the column at ``(x, z)``."""
 
-        for y in range(self.bounds.height - 1, -1, -1):
-            block = self._blocks.get((x, y, z))
-            if block and block.id != "air" and block.id != "water":
-                return y
-        return 0
+        return int(self._heightmap[x, z])
 
     def get_block(self, position: Coordinate) -> Block:
         """Return the block located at ``position``.
@@ -127,9 +316,21 @@ class World:
         players walking outside the world.
         """
 
-        if not self.bounds.contains(position):
+        x, y, z = position
+        if not (0 <= x < self._width and 0 <= y < self._height and 0 <= z < self._depth):
             return BLOCKS["stone"]
-        return self._blocks.get(position, BLOCKS["air"])
+        return ID2BLOCK[self._grid[x, y, z]]
+
+    def is_open(self, position: Coordinate) -> bool:
+        """Return whether ``position`` holds air or water.
+
+        Positions outside the world bounds are never open.
+        """
+
+        x, y, z = position
+        if not (0 <= x < self._width and 0 <= y < self._height and 0 <= z < self._depth):
+            return False
+        return bool(_OPEN[self._grid[x, y, z]])
 
     def set_block(self, position: Coordinate, block_id: str) -> bool:
         """Place ``block_id`` at ``position`` if inside bounds.
@@ -137,64 +338,53 @@ class World:
         Returns ``True`` if the block was placed.
         """
 
-        if not self.bounds.contains(position):
+        x, y, z = position
+        if not (0 <= x < self._width and 0 <= y < self._height and 0 <= z < self._depth):
             return False
-        self._blocks[position] = BLOCKS[block_id]
+        new_id = BLOCK2ID[block_id]
+        self._grid[x, y, z] = new_id
+        self._update_column(position, new_id)
+        self._revision += 1
         return True
 
     def remove_block(self, position: Coordinate) -> Optional[Block]:
         """Remove the block at ``position`` and return it."""
 
-        if not self.bounds.contains(position):
+        x, y, z = position
+        if not (0 <= x < self._width and 0 <= y < self._height and 0 <= z < self._depth):
+            return None
+        previous = int(self._grid[x, y, z])
+        if previous == AIR_ID:
             return None
-        return self._blocks.pop(position, None)
+        self._grid[x, y, z] = AIR_ID
+        self._update_column(position, AIR_ID)
+        self._revision += 1
+        return ID2BLOCK[previous]
 
     def top_view(self, center: Coordinate, radius: int = 6) -> str:
         """Return an ASCII map centered around ``center``."""
 
+        if radius < 0:
+            return ""
         cx, _, cz = center
-        lines = []
-        for dz in range(radius, -radius - 1, -1):
-            row = []
-            for dx in range(-radius, radius + 1):
-                x = cx + dx
-                z = cz + dz
-                if not (0 <= x < self.bounds.width and 0 <= z < self.bounds.depth):
-                    row.append(" ")
-                    continue
-                top_block = self._top_block_symbol(x, z)
-                row.append(top_block)
-            lines.append("".join(row))
-        return "\n".join(lines)
-
-    def _top_block_symbol(self, x: int, z: int) -> str:
-        symbols = {
-            "grass": "▒",
-            "sand": ".",
-            "dirt": "░",
-            "stone": "■",
-            "water": "~",
-            "log": "|",
-            "leaves": "*",
-            "planks": "#",
-        }
-        for y in range(self.bounds.height - 1, -1, -1):
-            block = self._blocks.get((x, y, z))
-            if block and block.id != "air":
-                return symbols.get(block.id, "?")
-        return " "
+        render = _compiled_top_view(int(radius))
+        return render(self._top_id, cx, cz, self._width, self._depth, _SYMBOL_TABLE)
 
     def neighbors(self, position: Coordinate) -> Iterator[Coordinate]:
         x, y, z = position
-        deltas = [(1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1)]
-        for dx, dy, dz in deltas:
-            neighbor = (x + dx, y + dy, z + dz)
-            if self.bounds.contains(neighbor):
-                yield neighbor
+        width, height, depth = self._width, self._height, self._depth
+        for dx, dy, dz in _NEIGHBOR_DELTAS:
+            nx, ny, nz = x + dx, y + dy, z + dz
+            if 0 <= nx < width and 0 <= ny < height and 0 <= nz < depth:
+                yield (nx, ny, nz)
 
     def describe(self, position: Coordinate) -> str:
         block = self.get_block(position)
         return f"{block.name}: {block.description}"
 
     def blocks(self) -> Iterable[Tuple[Coordinate, Block]]:
-        return self._blocks.items()
+        # Find the non-air cells in one scan, then convert to Python ints in bulk.
+        positions = np.argwhere(self._grid != AIR_ID)
+        ids = self._grid[positions[:, 0], positions[:, 1], positions[:, 2]]
+        for (x, y, z), block_id in zip(positions.tolist(), ids.tolist()):
+            yield (x, y, z), ID2BLOCK[block_id]
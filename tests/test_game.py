@@ -24,3 +24,10 @@ def test_unknown_command():
     game = Game(width=8, depth=8, height=16, seed=7)
     response = game.execute("fly")
     assert "do not understand" in response
+
+
+def test_command_aliases_share_handlers():
+    game = Game(width=8, depth=8, height=16, seed=8)
+    assert game.execute("where") == game.execute("POS")
+    assert game.execute("inv") == game.execute("inventory")
+    assert game.execute("exit") == "Thanks for playing!"
@@ -1,3 +1,5 @@
+import pytest
+
 from minecraft.player import Player
 from minecraft.world import World
 
@@ -32,3 +34,30 @@ def test_player_harvest_and_place_cycle():
     assert placed
     assert player.world.get_block(target).id == "log"
     assert player.inventory.get("log", 0) == 0
+
+
+def test_descriptions_refresh_after_changes():
+    player = make_player()
+    x, y, z = player.position
+    before = player.describe_surroundings()
+    assert player.describe_surroundings() == before
+    player.world.set_block((x, y, z), "log")
+    assert "oak log at head height" in player.describe_surroundings()
+    player.inventory["log"] = 2
+    assert "2 x Oak Log" in player.inventory_summary()
+
+
+def test_crafting_planks_yields_four():
+    player = make_player()
+    player.inventory["log"] = 1
+    assert player.craft("planks")
+    assert player.inventory["planks"] == 12
+    assert "log" not in player.inventory
+    assert not player.craft("planks")
+
+
+def test_unknown_direction_rejected():
+    player = make_player()
+    for direction in ("sideways", "u", "", "North"):
+        with pytest.raises(ValueError):
+            player.move(direction)
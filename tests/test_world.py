@@ -1,3 +1,7 @@
+import numpy as np
+import pytest
+
+from minecraft import world as world_module
 from minecraft.world import World
 
 
@@ -34,3 +38,67 @@ def test_water_fills_below_sea_level():
         if found_water:
             break
     assert found_water, "Expected at least one body of water in the world"
+
+
+def test_column_height_tracks_block_edits():
+    world = World(width=8, depth=8, height=20, seed=3)
+    x, z = 2, 5
+    top = world.column_height(x, z)
+    assert world.set_block((x, top + 2, z), "planks")
+    assert world.column_height(x, z) == top + 2
+    world.remove_block((x, top + 2, z))
+    assert world.column_height(x, z) == top
+    world.remove_block((x, top, z))
+    assert world.column_height(x, z) < top
+
+
+def test_top_view_shows_placed_block():
+    world = World(width=8, depth=8, height=20, seed=3)
+    x, z = 4, 4
+    world.set_block((x, world.bounds.height - 1, z), "planks")
+    rows = world.top_view((x, 0, z), radius=2).splitlines()
+    assert len(rows) == 5
+    assert rows[2][2] == "#"
+
+
+def test_is_open_only_for_air_and_water():
+    world = World(width=8, depth=8, height=20, seed=3)
+    position = (1, world.bounds.height - 1, 1)
+    assert world.is_open(position)
+    world.set_block(position, "leaves")
+    assert not world.is_open(position)
+    world.set_block(position, "water")
+    assert world.is_open(position)
+    assert not world.is_open((-1, 0, 0))
+
+
+def test_same_seed_worlds_do_not_share_edits():
+    world_a = World(width=8, depth=8, height=20, seed=11)
+    world_b = World(width=8, depth=8, height=20, seed=11)
+    position = (3, world_a.bounds.height - 1, 3)
+    world_a.set_block(position, "planks")
+    assert world_b.get_block(position).id == "air"
+    assert world_b.column_height(3, 3) < position[1]
+
+
+def test_negative_seed_matches_with_and_without_jit(monkeypatch):
+    pytest.importorskip("numba")
+    from minecraft import _jit
+
+    seed = -5 & world_module._SEED_MASK
+    # The hash wraps on purpose; uncompiled uint64 scalars would warn about it.
+    with np.errstate(over="ignore"):
+        expected = world_module._heightfield(16, 16, seed, 10, 22)
+        assert (_jit.heightfield(16, 16, seed, 10, 22) == expected).all()
+        # The uncompiled loops use Python ints, so they expose any int64 wrap-around.
+        uncompiled = getattr(_jit.heightfield, "py_func", _jit.heightfield)
+        assert (uncompiled(16, 16, seed, 10, 22) == expected).all()
+
+    plain = World(width=16, depth=16, height=24, seed=-5)
+    monkeypatch.setattr(world_module, "_JIT_MIN_COLUMNS", 1)
+    world_module._build_world.cache_clear()
+    try:
+        jitted = World(width=16, depth=16, height=24, seed=-5)
+    finally:
+        world_module._build_world.cache_clear()
+    assert dict(plain.blocks()) == dict(jitted.blocks())